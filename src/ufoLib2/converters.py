@@ -14,6 +14,8 @@ from cattr.gen import (
 )
 from fontTools.misc.transform import Transform
 
+from ufoLib2.objects.point import Point
+
 is_py37 = sys.version_info[:2] == (3, 7)
 
 if is_py37:
@@ -52,7 +54,7 @@ def is_ufoLib2_class_with_custom_structure(cls: Type[Any]) -> bool:
 def register_hooks(conv: GenConverter, allow_bytes: bool = True) -> None:
     def attrs_hook_factory(
         cls: Type[Any], gen_fn: Callable[..., Callable[[Any], Any]], structuring: bool
-    ) -> Callable[[Any], Any]:
+    ) -> Callable[..., Any]:
         base = get_origin(cls)
         if base is None:
             base = cls
@@ -89,7 +91,17 @@ def register_hooks(conv: GenConverter, allow_bytes: bool = True) -> None:
                 )
             kwargs[a.name] = attrib_override
 
-        return gen_fn(cls, conv, **kwargs)
+        fn: Callable[..., Any] = gen_fn(cls, conv, **kwargs)
+        if structuring and base is Point:
+            # same as the GLIF point pen: share one string object per point type
+            def structure_point(data: Any, cl: Type[Point]) -> Point:
+                point: Point = fn(data, cl)
+                if point.type is not None:
+                    point.type = sys.intern(point.type)
+                return point
+
+            return structure_point
+        return fn
 
     def custom_unstructure_hook_factory(cls: Type[Any]) -> Callable[[Any], Any]:
         return partial(cls._unstructure, converter=conv)
@@ -122,13 +134,14 @@ def register_hooks(conv: GenConverter, allow_bytes: bool = True) -> None:
     )
 
     if not allow_bytes:
-        from base64 import b64decode, b64encode
+        # call binascii directly, skipping the base64.b64encode/b64decode wrappers
+        from binascii import a2b_base64, b2a_base64
 
         def unstructure_bytes(v: bytes) -> str:
-            return (b64encode(v) if v else b"").decode("utf8")
+            return b2a_base64(v, newline=False).decode("ascii")
 
         def structure_bytes(v: str, _: Any) -> bytes:
-            return b64decode(v)
+            return a2b_base64(v)
 
         conv.register_unstructure_hook(bytes, unstructure_bytes)
         conv.register_structure_hook(bytes, structure_bytes)
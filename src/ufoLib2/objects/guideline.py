@@ -6,6 +6,15 @@ from attr import define
 
 from ufoLib2.objects.misc import AttrDictMixin
 
+# Maps (x is None, y is None, angle is None) to the error of invalid combinations.
+_GUIDELINE_ERRORS = {
+    (True, True, True): "x or y must be present",
+    (True, True, False): "x or y must be present",
+    (True, False, False): "if 'x' or 'y' are None, 'angle' must not be present",
+    (False, True, False): "if 'x' or 'y' are None, 'angle' must not be present",
+    (False, False, True): "if 'x' and 'y' are defined, 'angle' must be defined",
+}
+
 
 @define
 class Guideline(AttrDictMixin):
@@ -34,13 +43,9 @@ class Guideline(AttrDictMixin):
     """The globally unique identifier of the guideline."""
 
     def __attrs_post_init__(self) -> None:
-        x, y, angle = self.x, self.y, self.angle
-        if x is None and y is None:
-            raise ValueError("x or y must be present")
-        if x is None or y is None:
-            if angle is not None:
-                raise ValueError("if 'x' or 'y' are None, 'angle' must not be present")
-        if x is not None and y is not None and angle is None:
-            raise ValueError("if 'x' and 'y' are defined, 'angle' must be defined")
+        angle = self.angle
+        error = _GUIDELINE_ERRORS.get((self.x is None, self.y is None, angle is None))
+        if error is not None:
+            raise ValueError(error)
         if angle is not None and not (0 <= angle <= 360):
             raise ValueError("angle must be between 0 and 360")
@@ -14,15 +14,20 @@ class Kerning(Dict[KerningPair, float]):
     def as_nested_dicts(self) -> dict[str, dict[str, float]]:
         result: dict[str, dict[str, float]] = {}
         for (left, right), value in self.items():
-            result.setdefault(left, {})[right] = value
+            # unlike setdefault, this doesn't create a new empty dict for every pair
+            inner = result.get(left)
+            if inner is None:
+                result[left] = {right: value}
+            else:
+                inner[right] = value
         return result
 
     @classmethod
     def from_nested_dicts(self, kerning: Mapping[str, Mapping[str, float]]) -> Kerning:
         return Kerning(
-            ((left, right), kerning[left][right])
-            for left in kerning
-            for right in kerning[left]
+            ((left, right), value)
+            for left, pairs in kerning.items()
+            for right, value in pairs.items()
         )
 
     def _unstructure(self, converter: GenConverter) -> dict[str, dict[str, float]]:
@@ -76,6 +76,10 @@ class LayerSet:
 
     _reader: Optional[UFOReader] = field(default=None, init=False, eq=False)
 
+    # False while some layers are still lazy placeholders; lets __iter__ skip the
+    # per-item _LAYER_NOT_LOADED check once everything has been loaded.
+    _allLoaded: bool = field(default=True, init=False, eq=False, repr=False)
+
     def __attrs_post_init__(self) -> None:
         if self._defaultLayer == _LAYER_NOT_LOADED:
             found = False
@@ -88,7 +92,12 @@ class LayerSet:
             if not found:
                 raise ValueError("no layer marked as default")
         else:
-            if not any(layer is self._defaultLayer for layer in self._layers.values()):
+            defaultLayer = self._defaultLayer
+            # the layer is normally keyed by its own name, so try that first and only
+            # scan all the layers if it isn't found there.
+            if self._layers.get(defaultLayer.name) is not defaultLayer and not any(
+                layer is defaultLayer for layer in self._layers.values()
+            ):
                 raise ValueError(
                     f"default layer {repr(self._defaultLayer)} must be in layer set."
                 )
@@ -120,21 +129,21 @@ class LayerSet:
         layers: dict[str, Layer] = {}
         defaultLayer = None
         for layer in value:
-            if not isinstance(layer, Layer):
+            # exact Layer instances are by far the most common, test for those first
+            if type(layer) is not Layer and not isinstance(layer, Layer):
                 raise TypeError(f"expected 'Layer', found '{type(layer).__name__}'")
             if layer.name in layers:
                 raise KeyError(f"duplicate layer name: '{layer.name}'")
-            if layer.name == defaultLayerName or layer._default:
+            if layer._default or layer.name == defaultLayerName:
                 if defaultLayer is not None:
                     raise ValueError("more than one layer marked as default")
-                if not layer._default:
-                    layer._default = True
                 defaultLayer = layer
             layers[layer.name] = layer
 
         if defaultLayer is None:
             raise ValueError("no layer marked as default")
-        assert defaultLayer is not None
+        # only flag the layer named 'defaultLayerName' once all layers are validated
+        defaultLayer._default = True
 
         return cls(layers=layers, defaultLayer=defaultLayer)
 
@@ -147,33 +156,55 @@ class LayerSet:
             lazy: If True, load glyphs, data files and images as they are accessed. If
                 False, load everything up front.
         """
-        layers: dict[str, Layer] = {}
+        layers: dict[str, Layer]
         defaultLayer = None
 
         defaultLayerName = reader.getDefaultLayerName()
+        layerNames = reader.getLayerNames()
 
-        for layerName in reader.getLayerNames():
-            isDefault = layerName == defaultLayerName
-            if isDefault or not lazy:
+        if lazy:
+            # add placeholders for all layers in one go, keeping the layer order,
+            # then replace the one of the default layer, which is always loaded
+            layers = dict.fromkeys(layerNames, _LAYER_NOT_LOADED)
+            assert defaultLayerName in layers
+            defaultLayer = layers[defaultLayerName] = cls._loadLayer(
+                reader, defaultLayerName, lazy, default=True
+            )
+        else:
+            layers = {}
+            for layerName in layerNames:
+                isDefault = layerName == defaultLayerName
                 layer = cls._loadLayer(reader, layerName, lazy, isDefault)
                 if isDefault:
                     defaultLayer = layer
                 layers[layerName] = layer
-            else:
-                layers[layerName] = _LAYER_NOT_LOADED
 
         assert defaultLayer is not None
 
         self = cls(layers=layers, defaultLayer=defaultLayer)
         if lazy:
             self._reader = reader
+            # only the default layer has been loaded so far
+            self._allLoaded = len(layers) == 1
 
         return self
 
     def unlazify(self) -> None:
         """Load all layers into memory."""
-        for layer in self:
-            layer.unlazify()
+        pending = []
+        for name, layer in self._layers.items():
+            if layer is _LAYER_NOT_LOADED:
+                pending.append(name)
+            else:
+                layer.unlazify()
+        if pending:
+            reader = self._reader
+            assert reader is not None
+            # the remaining layers are read eagerly, then stored all at once
+            self._layers.update(
+                {name: self._loadLayer(reader, name, lazy=False) for name in pending}
+            )
+        self._allLoaded = True
 
     __deepcopy__ = _deepcopy_unlazify_attrs
 
@@ -187,11 +218,14 @@ class LayerSet:
     def loadLayer(self, layerName: str, lazy: bool = True) -> Layer:
         # XXX: Remove this method and do business via _loadLayer or take this one
         # private.
-        assert self._reader is not None
         if layerName not in self._layers:
             raise KeyError(layerName)
-        layer = self._loadLayer(self._reader, layerName, lazy)
-        self._layers[layerName] = layer
+        return self._loadLayerInPlace(layerName, lazy)
+
+    def _loadLayerInPlace(self, layerName: str, lazy: bool = True) -> Layer:
+        # same as loadLayer, only that the caller must ensure layerName is present
+        assert self._reader is not None
+        layer = self._layers[layerName] = self._loadLayer(self._reader, layerName, lazy)
         return layer
 
     @property
@@ -218,23 +252,27 @@ class LayerSet:
         return name in self._layers
 
     def __delitem__(self, name: str) -> None:
-        if self.defaultLayer is not None:
-            if name == self.defaultLayer.name:
-                raise KeyError("cannot delete default layer %r" % name)
+        if name == self._defaultLayer._name:
+            raise KeyError(f"cannot delete default layer {name!r}")
         del self._layers[name]
 
     def __getitem__(self, name: str) -> Layer:
         layer_object = self._layers[name]
         if layer_object is _LAYER_NOT_LOADED:
-            return self.loadLayer(name)
+            layer_object = self._loadLayerInPlace(name)
         return layer_object
 
     def __iter__(self) -> Iterator[Layer]:
+        if self._allLoaded:
+            yield from self._layers.values()
+            return
         for layer_name, layer_object in self._layers.items():
             if layer_object is _LAYER_NOT_LOADED:
-                yield self.loadLayer(layer_name)
+                yield self._loadLayerInPlace(layer_name)
             else:
                 yield layer_object
+        # only reached if the iteration wasn't interrupted
+        self._allLoaded = True
 
     def __len__(self) -> int:
         return len(self._layers)
@@ -277,11 +315,17 @@ class LayerSet:
 
     @layerOrder.setter
     def layerOrder(self, order: list[str]) -> None:
-        if set(order) != set(self._layers):
+        layers = self._layers
+        try:
+            newLayers = dict(zip(order, map(layers.__getitem__, order)))
+        except KeyError:
+            newLayers = {}
+        # the lengths differ if 'order' has unknown, missing or duplicate names
+        if len(newLayers) != len(layers) or len(order) != len(layers):
             raise Error(
                 "`order` must contain the same layers that are currently present."
             )
-        self._layers = {name: self._layers[name] for name in order}
+        self._layers = newLayers
 
     def newLayer(self, name: str, **kwargs: Any) -> Layer:
         """Creates and returns a named layer.
@@ -291,7 +335,7 @@ class LayerSet:
             kwargs: Arguments passed to the constructor of Layer.
         """
         if name in self._layers:
-            raise KeyError("layer %r already exists" % name)
+            raise KeyError(f"layer {name!r} already exists")
         self._layers[name] = layer = Layer(name, **kwargs)
         if layer._default:
             self.defaultLayer = layer
@@ -309,21 +353,26 @@ class LayerSet:
         # Note: this would be easier if the glyph contained the layers!
         if name == newName:
             return
-        # make sure we're copying something
-        if not any(name in layer for layer in self):
-            raise KeyError("name %r is not in layer set" % name)
-        # prepare destination, delete if overwrite=True or error
+        # find the layers to move from and to in one go
+        sources = []
+        targets = []
         for layer in self:
+            if name in layer:
+                sources.append(layer)
             if newName in layer:
-                if overwrite:
-                    del layer[newName]
-                else:
-                    raise KeyError("target name %r already exists" % newName)
+                targets.append(layer)
+        # make sure we're copying something
+        if not sources:
+            raise KeyError(f"name {name!r} is not in layer set")
+        # prepare destination, delete if overwrite=True or error
+        if targets and not overwrite:
+            raise KeyError(f"target name {newName!r} already exists")
+        for layer in targets:
+            del layer[newName]
         # now do the move
-        for layer in self:
-            if name in layer:
-                layer[newName] = glyph = layer.pop(name)
-                glyph._name = newName
+        for layer in sources:
+            layer[newName] = glyph = layer.pop(name)
+            glyph._name = newName
 
     def renameLayer(self, name: str, newName: str, overwrite: bool = False) -> None:
         """Renames a layer.
@@ -337,7 +386,7 @@ class LayerSet:
         if name == newName:
             return
         if not overwrite and newName in self._layers:
-            raise KeyError("target name %r already exists" % newName)
+            raise KeyError(f"target name {newName!r} already exists")
         layer = self[name]
         del self._layers[name]
         self._layers[newName] = layer
@@ -359,20 +408,26 @@ class LayerSet:
         # if in-place, remove deleted layers
         layers = self._layers
         if not saveAs:
-            for name in set(writer.getLayerNames()).difference(layers):
-                writer.deleteGlyphSet(name)
-        # write layers
+            # getLayerNames returns a new list, safe to delete while iterating it
+            for name in writer.getLayerNames():
+                if name not in layers:
+                    writer.deleteGlyphSet(name)
+        # write layers; bind the methods used in the loop to locals
         defaultLayer = self.defaultLayer
+        notLoaded = _LAYER_NOT_LOADED
+        loadLayer = self._loadLayerInPlace
+        getGlyphSet = writer.getGlyphSet
         for name, layer in layers.items():
             default = layer is defaultLayer
-            if layer is _LAYER_NOT_LOADED:
+            if layer is notLoaded:
                 if saveAs:
-                    layer = self.loadLayer(name, lazy=False)
+                    layer = loadLayer(name, lazy=False)
                 else:
                     continue
-            glyphSet = writer.getGlyphSet(name, defaultLayer=default)
+            glyphSet = getGlyphSet(name, defaultLayer=default)
             layer.write(glyphSet, saveAs=saveAs)
-        writer.writeLayerContents(self.layerOrder)
+        # the loop above only replaces values, so the keys are still in layer order
+        writer.writeLayerContents(list(layers))
 
     def _unstructure(self, converter: GenConverter) -> list[dict[str, Any]]:
         return [converter.unstructure(layer) for layer in self]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, Any
 
 from fontTools.misc.transform import Transform
@@ -47,6 +48,10 @@ class GlyphPointPen(AbstractPointPen):  # type: ignore
         if self._contour is None:
             raise ValueError("Call beginPath first.")
         x, y = pt
+        if segmentType is not None:
+            # the few point types repeat for every point in the font; share one
+            # string object per type instead of keeping a copy per point
+            segmentType = sys.intern(segmentType)
         self._contour.append(
             Point(
                 x, y, type=segmentType, smooth=smooth, name=name, identifier=identifier
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
+from ufoLib2.errors import Error
 from ufoLib2.objects import Font, Glyph, Guideline
 
 
@@ -83,6 +86,16 @@ def test_layer_order(ufo_UbuTestData: Font) -> None:
     font.layers.layerOrder = ["public.background", "public.default"]
     assert font.layers.layerOrder == ["public.background", "public.default"]
 
+    for order in (
+        ["public.default"],
+        ["public.default", "public.default"],
+        ["public.default", "public.background", "public.foo"],
+        ["public.default", "public.foo"],
+    ):
+        with pytest.raises(Error, match="`order` must contain the same layers"):
+            font.layers.layerOrder = order
+    assert font.layers.layerOrder == ["public.background", "public.default"]
+
 
 def test_bounds(ufo_UbuTestData: Font) -> None:
     font = ufo_UbuTestData
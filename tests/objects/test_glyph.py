@@ -403,3 +403,15 @@ def test_composite_margin_roundtrip(datadir: Path) -> None:
     assert quotedblleft.getLeftMargin(msans) == 23
     assert quotedblleft.getRightMargin(msans) == 22
     assert quotedblleft.width == 465
+
+
+def test_point_types_are_interned(datadir: Path) -> None:
+    font = Font.open(datadir / "MutatorSansBoldCondensed.ufo")
+    point_types: dict[str, set[int]] = {}
+    for glyph in font:
+        for contour in glyph.contours:
+            for point in contour:
+                if point.type is not None:
+                    point_types.setdefault(point.type, set()).add(id(point.type))
+    assert point_types
+    assert all(len(ids) == 1 for ids in point_types.values())
@@ -3,9 +3,10 @@ from __future__ import annotations
 import json
 import pathlib
 from base64 import b64encode
-from typing import Any
+from typing import Any, Callable
 
 import pytest
+from attr import define
 from fontTools.misc.transform import Transform
 
 from ufoLib2.constants import DATA_LIB_KEY
@@ -53,16 +54,17 @@ from ufoLib2.converters import register_hooks, structure, unstructure  # noqa: E
 
 
 @pytest.mark.parametrize(
-    "obj, expected",
+    "factory, expected",
     [
-        (Anchor(0, 0), {"x": 0, "y": 0}),
-        (
-            Anchor(1, -2, "top", "1,0,0,1", "01234"),
+        pytest.param(lambda: Anchor(0, 0), {"x": 0, "y": 0}, id="Anchor-minimal"),
+        pytest.param(
+            lambda: Anchor(1, -2, "top", "1,0,0,1", "01234"),
             {"x": 1, "y": -2, "name": "top", "color": "1,0,0,1", "identifier": "01234"},
+            id="Anchor-full",
         ),
-        (Point(0, 0), {"x": 0, "y": 0}),
-        (
-            Point(1.5, -2.1, "qcurve", True, "foobar", "12345"),
+        pytest.param(lambda: Point(0, 0), {"x": 0, "y": 0}, id="Point-minimal"),
+        pytest.param(
+            lambda: Point(1.5, -2.1, "qcurve", True, "foobar", "12345"),
             {
                 "x": 1.5,
                 "y": -2.1,
@@ -71,35 +73,45 @@ from ufoLib2.converters import register_hooks, structure, unstructure  # noqa: E
                 "name": "foobar",
                 "identifier": "12345",
             },
+            id="Point-full",
         ),
-        (Component("a"), {"baseGlyph": "a"}),
-        (
-            Component("b", Transform(1, 0, 0, 0.5, 10, 20), "abcd1234"),
+        pytest.param(
+            lambda: Component("a"), {"baseGlyph": "a"}, id="Component-minimal"
+        ),
+        pytest.param(
+            lambda: Component("b", Transform(1, 0, 0, 0.5, 10, 20), "abcd1234"),
             {
                 "baseGlyph": "b",
                 "transformation": (1, 0, 0, 0.5, 10, 20),
                 "identifier": "abcd1234",
             },
+            id="Component-full",
         ),
-        (Contour(), {}),
-        (
-            Contour([Point(0, 0), Point(1, 2)], "zzzz"),
+        pytest.param(Contour, {}, id="Contour-empty"),
+        pytest.param(
+            lambda: Contour([Point(0, 0), Point(1, 2)], "zzzz"),
             {"points": [{"x": 0, "y": 0}, {"x": 1, "y": 2}], "identifier": "zzzz"},
+            id="Contour-full",
         ),
-        (Image(), {}),
-        (
-            Image("path/to/image.png", Transform(2, 0, 0, 2, 0, 0), "1,1,1,1"),
+        pytest.param(Image, {}, id="Image-empty"),
+        pytest.param(
+            lambda: Image("path/to/image.png", Transform(2, 0, 0, 2, 0, 0), "1,1,1,1"),
             {
                 "fileName": "path/to/image.png",
                 "transformation": (2, 0, 0, 2, 0, 0),
                 "color": "1,1,1,1",
             },
+            id="Image-full",
         ),
-        (Lib(), {}),
-        (Lib(foo="bar"), {"foo": "bar"}),
-        (Lib(foo=[1, 2], bar={"baz": 3}), {"foo": [1, 2], "bar": {"baz": 3}}),
-        (
-            Lib(foo={"bar": b"baz"}, oof=[b"rab", "zab"]),
+        pytest.param(Lib, {}, id="Lib-empty"),
+        pytest.param(lambda: Lib(foo="bar"), {"foo": "bar"}, id="Lib-str"),
+        pytest.param(
+            lambda: Lib(foo=[1, 2], bar={"baz": 3}),
+            {"foo": [1, 2], "bar": {"baz": 3}},
+            id="Lib-nested",
+        ),
+        pytest.param(
+            lambda: Lib(foo={"bar": b"baz"}, oof=[b"rab", "zab"]),
             {
                 "foo": {
                     "bar": {"data": "YmF6", "type": DATA_LIB_KEY},
@@ -109,11 +121,20 @@ from ufoLib2.converters import register_hooks, structure, unstructure  # noqa: E
                     "zab",
                 ],
             },
+            id="Lib-bytes",
+        ),
+        pytest.param(
+            lambda: Guideline(x=0, name="foo"),
+            {"x": 0, "name": "foo"},
+            id="Guideline-x",
+        ),
+        pytest.param(
+            lambda: Guideline(y=1, name="bar"),
+            {"y": 1, "name": "bar"},
+            id="Guideline-y",
         ),
-        (Guideline(x=0, name="foo"), {"x": 0, "name": "foo"}),
-        (Guideline(y=1, name="bar"), {"y": 1, "name": "bar"}),
-        (
-            Guideline(
+        pytest.param(
+            lambda: Guideline(
                 x=1, y=2, angle=45.0, name="baz", color="0,1,0.5,1", identifier="0001"
             ),
             {
@@ -124,10 +145,11 @@ from ufoLib2.converters import register_hooks, structure, unstructure  # noqa: E
                 "color": "0,1,0.5,1",
                 "identifier": "0001",
             },
+            id="Guideline-full",
         ),
-        (Glyph(), {}),
-        (
-            Glyph(
+        pytest.param(Glyph, {}, id="Glyph-empty"),
+        pytest.param(
+            lambda: Glyph(
                 "a",
                 width=1000,
                 height=800,
@@ -180,14 +202,16 @@ from ufoLib2.converters import register_hooks, structure, unstructure  # noqa: E
                 ],
                 "guidelines": [{"x": 10}],
             },
+            id="Glyph-full",
         ),
-        (Kerning(), {}),
-        (
-            Kerning({("a", "b"): -10, ("a", "d"): 5, ("b", "d"): 0}),
+        pytest.param(Kerning, {}, id="Kerning-empty"),
+        pytest.param(
+            lambda: Kerning({("a", "b"): -10, ("a", "d"): 5, ("b", "d"): 0}),
             {"a": {"b": -10, "d": 5}, "b": {"d": 0}},
+            id="Kerning-full",
         ),
-        (
-            Info(
+        pytest.param(
+            lambda: Info(
                 familyName="Test",
                 styleName="Bold",
                 versionMajor=2,
@@ -415,13 +439,18 @@ from ufoLib2.converters import register_hooks, structure, unstructure  # noqa: E
                     }
                 ],
             },
+            id="Info-full",
         ),
         # 'public.default' is a special case, default=True by definition
-        (Layer(), {"name": "public.default"}),
-        (Layer("foo", default=True), {"name": "foo", "default": True}),
-        (Layer("bar"), {"name": "bar"}),
-        (
-            Layer(
+        pytest.param(Layer, {"name": "public.default"}, id="Layer-public.default"),
+        pytest.param(
+            lambda: Layer("foo", default=True),
+            {"name": "foo", "default": True},
+            id="Layer-default",
+        ),
+        pytest.param(lambda: Layer("bar"), {"name": "bar"}, id="Layer-non-default"),
+        pytest.param(
+            lambda: Layer(
                 name="foreground",
                 glyphs={"a": Glyph(), "b": Glyph()},
                 color="1,0,1,1",
@@ -435,28 +464,37 @@ from ufoLib2.converters import register_hooks, structure, unstructure  # noqa: E
                 "lib": {"foobar": 0.1},
                 "default": True,
             },
+            id="Layer-full",
         ),
-        (LayerSet.default(), [{"name": "public.default"}]),
-        (
-            LayerSet.from_iterable(
+        pytest.param(
+            LayerSet.default, [{"name": "public.default"}], id="LayerSet-default"
+        ),
+        pytest.param(
+            lambda: LayerSet.from_iterable(
                 [Layer("foreground"), Layer("background")],
                 defaultLayerName="foreground",  # deprecated
             ),
             [{"name": "foreground", "default": True}, {"name": "background"}],
+            id="LayerSet-defaultLayerName",
         ),
-        (
-            LayerSet.from_iterable(
+        pytest.param(
+            lambda: LayerSet.from_iterable(
                 [Layer("foreground", default=True), Layer("background")],
             ),
             [{"name": "foreground", "default": True}, {"name": "background"}],
+            id="LayerSet-default-attribute",
+        ),
+        pytest.param(DataSet, {}, id="DataSet-empty"),
+        pytest.param(
+            lambda: DataSet({"foo": b"bar"}), {"foo": "YmFy"}, id="DataSet-full"
+        ),
+        pytest.param(ImageSet, {}, id="ImageSet-empty"),
+        pytest.param(
+            lambda: ImageSet({"foo": b"bar"}), {"foo": "YmFy"}, id="ImageSet-full"
         ),
-        (DataSet(), {}),
-        (DataSet({"foo": b"bar"}), {"foo": "YmFy"}),
-        (ImageSet(), {}),
-        (ImageSet({"foo": b"bar"}), {"foo": "YmFy"}),
-        (Font(), {"layers": [{"name": "public.default"}]}),
-        (
-            Font(
+        pytest.param(Font, {"layers": [{"name": "public.default"}]}, id="Font-empty"),
+        pytest.param(
+            lambda: Font(
                 layers=[
                     Layer(name="foreground", default=True),
                     Layer(name="background"),
@@ -468,9 +506,10 @@ from ufoLib2.converters import register_hooks, structure, unstructure  # noqa: E
                     {"name": "background"},
                 ],
             },
+            id="Font-layers",
         ),
-        (
-            Font(
+        pytest.param(
+            lambda: Font(
                 layers=[Layer(glyphs=[Glyph("a")])],
                 info=Info(familyName="Test"),
                 features="languagesystem DFLT dflt;",
@@ -495,10 +534,15 @@ from ufoLib2.converters import register_hooks, structure, unstructure  # noqa: E
                 "data": {"baz": "AA=="},
                 "images": {"foobarbaz": "AA=="},
             },
+            id="Font-full",
         ),
     ],
 )
-def test_unstructure_structure(obj: Any, expected: dict[str, Any]) -> None:
+def test_unstructure_structure(
+    factory: Callable[[], Any], expected: dict[str, Any]
+) -> None:
+    # objects are built lazily, only for the test cases that are actually run
+    obj = factory()
     assert unstructure(obj) == expected
     assert structure(expected, type(obj)) == obj
 
@@ -609,6 +653,7 @@ def test_omit_if_default(obj: Any, expected: Any, omit_if_default: bool) -> None
     [
         pytest.param(True, b"foo", b"foo", id="True-bytes"),
         pytest.param(False, b"foo", b64encode(b"foo").decode(), id="False-bytes"),
+        pytest.param(False, b"", "", id="False-empty-bytes"),
         pytest.param(
             True, DataSet({"foo": b"bar"}), {"foo": b"bar"}, id="True-DataSet"
         ),
@@ -699,3 +744,27 @@ def test_json_loads(datadir: pathlib.Path) -> None:
     expected.features.normalize_newlines()
 
     assert structure(data, Font) == expected
+
+
+def test_structure_point_type_is_interned() -> None:
+    data = json.loads(
+        '{"points": [{"x": 0, "y": 0, "type": "line"}, {"x": 1, "y": 1, "type": "line"}]}'
+    )
+    # strings decoded by json are not shared between objects
+    assert data["points"][0]["type"] is not data["points"][1]["type"]
+
+    contour = structure(data, Contour)
+
+    assert contour[0].type == "line"
+    assert contour[0].type is contour[1].type
+
+
+def test_structure_point_subclass() -> None:
+    @define
+    class MyPoint(Point):
+        extra: int = 0
+
+    point = structure({"x": 1, "y": 2, "type": "line", "extra": 3}, MyPoint)
+
+    assert type(point) is MyPoint
+    assert point == MyPoint(1, 2, "line", extra=3)
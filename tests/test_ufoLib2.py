@@ -10,6 +10,7 @@ from fontTools import ufoLib
 import ufoLib2
 import ufoLib2.objects
 from ufoLib2.objects import Features, Font, Glyph, Kerning, Layer, LayerSet, Lib
+from ufoLib2.objects.layer import _GLYPH_NOT_LOADED
 from ufoLib2.objects.layerSet import _LAYER_NOT_LOADED
 from ufoLib2.objects.misc import _DATA_NOT_LOADED
 
@@ -26,8 +27,40 @@ def test_LayerSet_load_layers_on_iteration(tmp_path: Path) -> None:
     ufo.save(ufo_save_path)
     ufo = ufoLib2.Font.open(ufo_save_path)
     assert set(ufo.layers.keys()) == {"public.default", "test"}
+    assert any(v is _LAYER_NOT_LOADED for v in ufo.layers._layers.values())
     for layer in ufo.layers:
         assert layer is not _LAYER_NOT_LOADED
+    assert ufo.layers._allLoaded
+    assert all(layer is not _LAYER_NOT_LOADED for layer in ufo.layers._layers.values())
+
+
+def test_LayerSet_read_preserves_layer_order(tmp_path: Path) -> None:
+    ufo = ufoLib2.Font(layers=[Layer("foo"), Layer(), Layer("bar")])
+    ufo_save_path = tmp_path / "test.ufo"
+    ufo.save(ufo_save_path)
+
+    for lazy in (True, False):
+        ufo = ufoLib2.Font.open(ufo_save_path, lazy=lazy)
+        assert ufo.layers.layerOrder == ["foo", "public.default", "bar"]
+        assert ufo.layers._layers["public.default"] is ufo.layers.defaultLayer
+
+
+def test_LayerSet_delete_layers_inplace(tmp_path: Path) -> None:
+    ufo = ufoLib2.Font()
+    ufo.layers.newLayer("foo")
+    ufo.layers.newLayer("bar")
+    ufo_save_path = tmp_path / "test.ufo"
+    ufo.save(ufo_save_path)
+
+    ufo = ufoLib2.Font.open(ufo_save_path)
+    with pytest.raises(KeyError, match="cannot delete default layer"):
+        del ufo.layers["public.default"]
+    del ufo.layers["foo"]
+    ufo.save()
+
+    ufo = ufoLib2.Font.open(ufo_save_path)
+    assert ufo.layers.layerOrder == ["public.default", "bar"]
+    assert not (ufo_save_path / "glyphs.foo").exists()
 
 
 def test_lazy_data_loading_saveas(ufo_UbuTestData: Font, tmp_path: Path) -> None:
@@ -96,6 +129,10 @@ def test_unlazify(datadir: Path) -> None:
     font.unlazify()
 
     assert font._lazy is False
+    assert font.layers._allLoaded
+    for layer in font.layers._layers.values():
+        assert layer is not _LAYER_NOT_LOADED
+        assert all(g is not _GLYPH_NOT_LOADED for g in layer._glyphs.values())
 
 
 def test_auto_unlazify_font(datadir: Path) -> None:
@@ -163,6 +200,9 @@ def test_custom_layerset() -> None:
     with pytest.raises(KeyError, match="duplicate layer name"):
         LayerSet.from_iterable([Layer("a", default=True), Layer("a")])
 
+    with pytest.raises(TypeError, match="expected 'Layer', found 'str'"):
+        LayerSet.from_iterable([Layer("a", default=True), "b"])  # type: ignore
+
     with pytest.raises(ValueError, match="default layer .* must be in layer set"):
         LayerSet(layers={"public.default": Layer()}, defaultLayer=Layer())
 
@@ -171,6 +211,13 @@ def test_custom_layerset() -> None:
     assert ls2["abc"].default
     assert ls2["abc"] is ls2.defaultLayer
 
+    abc = Layer(name="abc")
+    with pytest.raises(ValueError, match="more than one layer marked as default"):
+        LayerSet.from_iterable(
+            [abc, Layer("def", default=True)], defaultLayerName="abc"
+        )
+    assert not abc.default
+
     # defaultLayer is set automatically based on Layer.default attribute
     ls3 = LayerSet.from_iterable([Layer(name="abc", default=True), Layer("def")])
     assert ls3["abc"].default
@@ -227,6 +274,29 @@ def test_change_default_layer_invalid() -> None:
         font.layers.defaultLayer = Layer("foobar")
 
 
+def test_layerset_rename_glyph() -> None:
+    layers = LayerSet.from_iterable(
+        [
+            Layer(glyphs=[Glyph("a"), Glyph("b")]),
+            Layer("background", glyphs=[Glyph("a")]),
+            Layer("sketches", glyphs=[Glyph("c")]),
+        ]
+    )
+
+    with pytest.raises(KeyError, match="name 'z' is not in layer set"):
+        layers.renameGlyph("z", "y")
+
+    with pytest.raises(KeyError, match="target name 'b' already exists"):
+        layers.renameGlyph("a", "b")
+    assert "a" in layers["public.default"] and "a" in layers["background"]
+
+    layers.renameGlyph("a", "c", overwrite=True)
+    assert set(layers["public.default"].keys()) == {"b", "c"}
+    assert set(layers["background"].keys()) == {"c"}
+    assert len(layers["sketches"]) == 0
+    assert layers["background"]["c"].name == "c"
+
+
 def test_guidelines() -> None:
     font = ufoLib2.Font()
 
@@ -250,6 +320,22 @@ def test_guidelines() -> None:
     ]
 
 
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({}, "x or y must be present"),
+        ({"name": "foo"}, "x or y must be present"),
+        ({"x": 1, "angle": 90}, "if 'x' or 'y' are None, 'angle' must not be present"),
+        ({"y": 1, "angle": 90}, "if 'x' or 'y' are None, 'angle' must not be present"),
+        ({"x": 1, "y": 1}, "if 'x' and 'y' are defined, 'angle' must be defined"),
+        ({"x": 1, "y": 1, "angle": 361}, "angle must be between 0 and 360"),
+    ],
+)
+def test_guideline_invalid(kwargs: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        ufoLib2.objects.Guideline(**kwargs)
+
+
 def test_woff_metadata(datadir: Path, tmp_path: Path) -> None:
     # The WoffMetadataTest.ufo contains all the WOFF metadata, here we check
     # that ufoLib validators accept the data and can read/write fontinfo.plist.